@@ -1,16 +1,516 @@
 # -*- coding: latin-1 -*-
 from datetime import date, datetime
+from typing import Optional
 import calendar
-import holidays
+import struct
 from dateutil.relativedelta import relativedelta
 """
     - Created By: Delvidio Demarchi Neto
     - Created Date: 03/04/2023
-    - Laste Update: 18/11/2025
+    - Laste Update: 18/10/2026
     - Version: '2.0.0'
 """
 
 
+def _getLastMondayOfMonth(year: int, month: int) -> date:
+    """Retorna a última segunda-feira do mês.
+
+    Args:
+        year: Ano.
+        month: Mês (1-12).
+
+    Returns:
+        date: Última segunda-feira do mês especificado.
+    """
+    # Último dia do mês
+    if month == 12:
+        last_day = date(year, 12, 31)
+    else:
+        last_day = date(year, month + 1, 1) - relativedelta(days=1)
+
+    # Encontra a última segunda-feira do mês
+    if last_day.weekday() == 0:
+        return last_day
+    else:
+        days_back = last_day.weekday()
+        return last_day - relativedelta(days=days_back)
+
+
+def _getLastCompleteWeekMonday(year: int, month: int) -> date:
+    """Retorna a última segunda-feira do mês onde a semana está completa.
+
+    Semana completa: segunda a domingo, todos os dias dentro do mês.
+
+    Args:
+        year: Ano.
+        month: Mês (1-12).
+
+    Returns:
+        date: Última segunda-feira onde a semana completa está dentro do mês.
+    """
+    # Último dia do mês
+    if month == 12:
+        last_day = date(year, 12, 31)
+    else:
+        last_day = date(year, month + 1, 1) - relativedelta(days=1)
+
+    # Encontra a última segunda-feira do mês
+    if last_day.weekday() == 0:
+        last_monday = last_day
+    else:
+        days_back = last_day.weekday()
+        last_monday = last_day - relativedelta(days=days_back)
+
+    # Verifica se a semana está completa (domingo ainda está no mês)
+    week_end = last_monday + relativedelta(days=6)  # Domingo da semana
+
+    # Se o domingo não está no mesmo mês, retrocede uma semana
+    # A última semana completa: domingo é o último dia do mês
+    if week_end.month != month or week_end.year != year:
+        last_monday = last_monday - relativedelta(weeks=1)
+
+    return last_monday
+
+
+def _getLastCompleteWeekSunday(year: int, month: int) -> date:
+    """Retorna o domingo da última semana completa do mês.
+
+    Args:
+        year: Ano.
+        month: Mês (1-12).
+
+    Returns:
+        date: Domingo da última semana completa do mês.
+    """
+    last_monday = _getLastCompleteWeekMonday(year, month)
+    return last_monday + relativedelta(days=6)  # Domingo da semana
+
+
+def _getFiscalYearStart(year: int) -> date:
+    """Retorna a data de início do ano fiscal.
+
+    O ano fiscal N começa na última segunda-feira de novembro do ano N-1
+    onde a semana está completa.
+
+    Args:
+        year: Ano fiscal.
+
+    Returns:
+        date: Data de início do ano fiscal (última segunda-feira de novembro do ano anterior).
+    """
+    return _getLastCompleteWeekMonday(year - 1, 11)
+
+
+def _getFiscalMonthInfo(fiscal_year_start: date, fiscal_month: int, fiscal_year: int):
+    """Retorna início e fim de um mês fiscal.
+
+    Cada mês fiscal começa na segunda-feira e termina no domingo.
+    O mês fiscal 1 começa na última segunda-feira de dezembro (se dia >= 28)
+    ou na primeira segunda-feira de janeiro. O mês fiscal 12 termina no
+    primeiro domingo de janeiro do ano seguinte que fecha semana completa.
+
+    Args:
+        fiscal_year_start: Data de início do ano fiscal.
+        fiscal_month: Mês fiscal (1-12).
+        fiscal_year: Ano fiscal.
+
+    Returns:
+        tuple: (data_início, data_fim) do mês fiscal.
+    """
+    if fiscal_month == 1:
+        # Mês fiscal 1: começa na última segunda-feira de dezembro do ano anterior
+        # OU na primeira segunda-feira de janeiro, a que for mais próxima do início do ano
+        # Encontra a última segunda-feira de dezembro (não necessariamente onde semana está completa)
+        dec_last = date(fiscal_year - 1, 12, 31)
+        if dec_last.weekday() == 0:
+            dec_last_monday = dec_last
+        else:
+            days_back = dec_last.weekday()
+            dec_last_monday = dec_last - relativedelta(days=days_back)
+
+        jan_first = date(fiscal_year, 1, 1)
+
+        # Calcula a primeira segunda-feira de janeiro
+        if jan_first.weekday() == 0:
+            jan_first_monday = jan_first
+        else:
+            days_to_monday = (7 - jan_first.weekday()) % 7
+            if days_to_monday == 0:
+                days_to_monday = 7
+            jan_first_monday = jan_first + relativedelta(days=days_to_monday)
+
+        # Regra: se 1º de janeiro é segunda-feira, usa ele
+        # Caso contrário, usa a última segunda-feira de dezembro se ela estiver em 28, 29, 30 ou 31 de dezembro
+        # Senão usa a primeira segunda-feira de janeiro
+        if jan_first.weekday() == 0:
+            # 1º de janeiro é segunda-feira, usa ele
+            month_start = jan_first
+        else:
+            # Verifica se a última segunda-feira de dezembro está no final de dezembro (28-31)
+            if dec_last_monday.day >= 28:
+                # Última segunda-feira de dezembro está no final do mês, usa ela
+                month_start = dec_last_monday
+            else:
+                # Usa a primeira segunda-feira de janeiro
+                month_start = jan_first_monday
+
+        # Termina no último domingo de janeiro
+        month_end = _getLastCompleteWeekSunday(fiscal_year, 1)
+
+    elif fiscal_month == 12:
+        # Mês fiscal 12: começa na última segunda-feira de novembro onde a semana está completa
+        month_start = _getLastCompleteWeekMonday(fiscal_year, 11)
+
+        # Termina no primeiro domingo de janeiro do ano seguinte que fecha uma semana completa
+        # a partir do início do mês 12
+        jan_first = date(fiscal_year + 1, 1, 1)
+
+        # Encontra o primeiro domingo de janeiro
+        if jan_first.weekday() == 6:  # Domingo
+            first_sunday = jan_first
+        else:
+            days_to_sunday = (6 - jan_first.weekday()) % 7
+            if days_to_sunday == 0:
+                days_to_sunday = 7
+            first_sunday = jan_first + relativedelta(days=days_to_sunday)
+
+        # Verifica se o primeiro domingo de janeiro fecha uma semana completa
+        days_diff = (first_sunday - month_start).days
+        if (days_diff + 1) % 7 == 0:  # Fecha semana completa
+            month_end = first_sunday
+        else:
+            # Não fecha, vai até o próximo domingo
+            month_end = first_sunday + relativedelta(weeks=1)
+
+    else:
+        # Meses fiscais 2-11: mapeia para meses calendário
+        # Mês fiscal 2 = janeiro, 3 = fevereiro, ..., 11 = outubro
+        calendar_month = fiscal_month - 1
+
+        # Início: última segunda-feira do mês calendário correspondente
+        # Mês fiscal 2 começa na última segunda-feira de janeiro
+        # Mês fiscal 3 começa na última segunda-feira de fevereiro
+        # etc.
+        month_start = _getLastMondayOfMonth(fiscal_year, calendar_month)
+
+        # Fim: último domingo do mês calendário seguinte
+        # Mês fiscal 2 termina no último domingo de fevereiro
+        # Mês fiscal 3 termina no último domingo de março (ou primeiro domingo de abril)
+        next_calendar_month = calendar_month + 1
+        if next_calendar_month > 12:
+            next_calendar_month = 1
+            next_calendar_year = fiscal_year + 1
+        else:
+            next_calendar_year = fiscal_year
+
+        month_end = _getLastCompleteWeekSunday(next_calendar_year, next_calendar_month)
+
+        # Verifica se fecha uma semana completa
+        # Para fechar semana completa (segunda a domingo), (days + 1) deve ser múltiplo de 7
+        days_diff = (month_end - month_start).days
+        if (days_diff + 1) % 7 != 0:  # Não fecha semana completa
+            # Vai até o primeiro domingo do mês seguinte seguinte
+            if next_calendar_month == 12:
+                next_next_month = 1
+                next_next_year = next_calendar_year + 1
+            else:
+                next_next_month = next_calendar_month + 1
+                next_next_year = next_calendar_year
+
+            next_next_month_first = date(next_next_year, next_next_month, 1)
+            if next_next_month_first.weekday() == 6:  # Domingo
+                first_sunday = next_next_month_first
+            else:
+                days_to_sunday = (6 - next_next_month_first.weekday()) % 7
+                if days_to_sunday == 0:
+                    days_to_sunday = 7
+                first_sunday = next_next_month_first + relativedelta(days=days_to_sunday)
+
+            # Verifica se esse domingo fecha uma semana completa
+            days_diff2 = (first_sunday - month_start).days
+            if (days_diff2 + 1) % 7 == 0:
+                month_end = first_sunday
+            else:
+                # Ainda não fecha, vai até o próximo domingo
+                month_end = first_sunday + relativedelta(weeks=1)
+
+    return month_start, month_end
+
+
+def _getFiscalMonthFromDate(vDate: date, getFiscalYearStart=_getFiscalYearStart,
+                            getFiscalMonthInfo=_getFiscalMonthInfo) -> tuple:
+    """Determina o ano e mês fiscal para uma data.
+
+    Args:
+        vDate: Data a ser analisada.
+        getFiscalYearStart: Função que retorna o início do ano fiscal
+            (permite usar as tabelas de um compiledcalendar).
+        getFiscalMonthInfo: Função que retorna início e fim de um mês fiscal.
+
+    Returns:
+        tuple: (ano_fiscal, mês_fiscal) onde mês_fiscal é 1-12.
+    """
+    year = vDate.year
+    month = vDate.month
+
+    # Tenta determinar o ano fiscal testando anos próximos
+    # O ano fiscal N começa em novembro do ano N-1
+    for test_year in [year - 1, year, year + 1]:
+        fiscal_year_start = getFiscalYearStart(test_year)
+        # Calcula o fim do ano fiscal (mês 12)
+        month12_start, month12_end = getFiscalMonthInfo(fiscal_year_start, 12, test_year)
+
+        if fiscal_year_start <= vDate <= month12_end:
+            fiscal_year = test_year
+            # Agora determina qual mês fiscal
+            # Testa cada mês fiscal
+            for test_month in range(1, 13):
+                month_start, month_end = getFiscalMonthInfo(fiscal_year_start, test_month, fiscal_year)
+                if month_start <= vDate <= month_end:
+                    return fiscal_year, test_month
+            # Se não encontrou, retorna o mês 12
+            return fiscal_year, 12
+
+    # Se não encontrou em nenhum ano, assume o ano atual
+    # e tenta determinar o mês baseado no mês calendário
+    fiscal_year = year
+    if month == 11 or month == 12:
+        # Novembro ou dezembro podem ser mês 1 ou 12
+        # Verifica qual
+        fiscal_year_start = getFiscalYearStart(year)
+        month1_start, month1_end = getFiscalMonthInfo(fiscal_year_start, 1, year)
+        if month1_start <= vDate <= month1_end:
+            return year, 1
+        else:
+            return year, 12
+    elif month == 1:
+        # Janeiro pode ser mês 2 ou 3
+        fiscal_year_start = getFiscalYearStart(year)
+        month2_start, month2_end = getFiscalMonthInfo(fiscal_year_start, 2, year)
+        if month2_start <= vDate <= month2_end:
+            return year, 2
+        else:
+            return year, 3
+    else:
+        # Meses 2-10: mês fiscal = mês calendário + 2
+        # (fevereiro = mês fiscal 4, março = 5, etc.)
+        fiscal_month = month + 2
+        if fiscal_month > 12:
+            fiscal_month = 12
+        return year, fiscal_month
+
+
+class compiledcalendar():
+    """Calendário compilado de dias úteis e meses fiscais.
+
+    Pré-calcula, para um intervalo de anos, os feriados (um bit por dia), a
+    máscara de fim de semana e a tabela de início/fim dos meses fiscais (4-4-5).
+    Depois de compilado não depende mais da biblioteca holidays e, serializado
+    com pickle, ocupa poucos KB. Pode ser usado como variável broadcast em
+    executores Spark/Dask e passado diretamente para intdate (parâmetro Calendar).
+
+    Args:
+        StartYear (int): Primeiro ano coberto pelo calendário.
+        EndYear (int): Último ano coberto pelo calendário.
+        Country (str, optional): Código do país para os feriados. Se vazio, apenas o fim de semana é considerado.
+        State (str, optional): Código do estado/província para os feriados.
+        Weekend (bool, optional): Se False, sábado não é dia útil. Se True, apenas domingo não é dia útil.
+
+    Examples:
+        >>> from bonniebully import intdate, compiledcalendar
+        >>> from datetime import date
+        >>> 
+        >>> # Compila uma vez no driver e envia para os executores
+        >>> cal = compiledcalendar(2020, 2030, 'BR', 'SP')
+        >>> bcal = spark.sparkContext.broadcast(cal)
+        >>> 
+        >>> # Nos executores, nenhum acesso à biblioteca holidays
+        >>> result = intdate('BDAY', date(2024, 1, 15), 5, 'S', Calendar=bcal.value).getDates()
+    """
+
+    def __init__(self, StartYear: int, EndYear: int, Country: str = "", State: str = "",
+                 Weekend: bool = False):
+
+        # Validação de parâmetros
+        if not isinstance(StartYear, int) or not isinstance(EndYear, int):
+            raise TypeError("StartYear e EndYear devem ser números inteiros")
+        if StartYear > EndYear:
+            raise ValueError("StartYear deve ser menor ou igual a EndYear")
+        if StartYear < 3 or EndYear > 9997:
+            raise ValueError("StartYear e EndYear devem estar entre 3 e 9997")
+
+        self._StartYear = StartYear
+        self._EndYear = EndYear
+        self._Country = Country
+        self._State = State
+        self._Weekend = bool(Weekend)
+
+        # Bitset de feriados: um bit por dia a partir de 1º de janeiro de StartYear
+        self._FirstOrdinal = date(StartYear, 1, 1).toordinal()
+        self._Days = date(EndYear, 12, 31).toordinal() - self._FirstOrdinal + 1
+        vBits = bytearray((self._Days + 7) // 8)
+        if Country:
+            import holidays
+            vHolidays = holidays.country_holidays(
+                Country, subdiv=State, years=range(StartYear, EndYear + 1))
+            for vHoliday in vHolidays:
+                offset = vHoliday.toordinal() - self._FirstOrdinal
+                if 0 <= offset < self._Days:
+                    vBits[offset >> 3] |= 1 << (offset & 7)
+        self._Holidays = bytes(vBits)
+
+        # Tabela fiscal: cobre um ano a mais de cada lado, pois a busca do mês
+        # fiscal de uma data testa os anos vizinhos. Para cada ano fiscal guarda
+        # o início do ano e os pares (início, fim) dos 12 meses, como deslocamento
+        # em dias a partir de 1º de janeiro de StartYear - 2.
+        self._FiscalBase = date(StartYear - 2, 1, 1).toordinal()
+        vFiscal = []
+        for fiscal_year in range(StartYear - 1, EndYear + 2):
+            fiscal_year_start = _getFiscalYearStart(fiscal_year)
+            vFiscal.append(fiscal_year_start.toordinal() - self._FiscalBase)
+            for fiscal_month in range(1, 13):
+                month_start, month_end = _getFiscalMonthInfo(fiscal_year_start, fiscal_month, fiscal_year)
+                vFiscal.append(month_start.toordinal() - self._FiscalBase)
+                vFiscal.append(month_end.toordinal() - self._FiscalBase)
+        self._Fiscal = tuple(vFiscal)
+
+    def __getstate__(self):
+        # Serializa as tabelas como bytes para manter o pickle compacto
+        vFormat = "H" if max(self._Fiscal) <= 0xFFFF else "I"
+        vFiscal = struct.pack("<%d%s" % (len(self._Fiscal), vFormat), *self._Fiscal)
+        return (self._StartYear, self._EndYear, self._Country, self._State,
+                self._Weekend, self._Holidays, vFormat, vFiscal)
+
+    def __setstate__(self, state):
+        (self._StartYear, self._EndYear, self._Country, self._State,
+         self._Weekend, self._Holidays, vFormat, vFiscal) = state
+        self._FirstOrdinal = date(self._StartYear, 1, 1).toordinal()
+        self._Days = date(self._EndYear, 12, 31).toordinal() - self._FirstOrdinal + 1
+        self._FiscalBase = date(self._StartYear - 2, 1, 1).toordinal()
+        self._Fiscal = struct.unpack("<%d%s" % (len(vFiscal) // struct.calcsize(vFormat), vFormat), vFiscal)
+
+    @property
+    def Country(self) -> str:
+        """str: Código do país usado na compilação."""
+        return self._Country
+
+    @property
+    def State(self) -> str:
+        """str: Código do estado/província usado na compilação."""
+        return self._State
+
+    @property
+    def Weekend(self) -> bool:
+        """bool: Se True, apenas domingo não é dia útil."""
+        return self._Weekend
+
+    def __repr__(self):
+        return (f"compiledcalendar({self._StartYear}, {self._EndYear}, '{self._Country}', "
+                f"'{self._State}', Weekend={self._Weekend})")
+
+    @staticmethod
+    def __toDate(Date) -> date:
+        """Converte 'YYYY-MM-DD', date ou datetime para date."""
+        if isinstance(Date, str) is True:
+            return datetime.strptime(Date, '%Y-%m-%d').date()
+        if isinstance(Date, datetime):
+            return Date.date()
+        return Date
+
+    def isHoliday(self, Date: date) -> bool:
+        """Verifica se uma data é feriado.
+
+        Args:
+            Date (date ou str): Data a verificar, no formato 'YYYY-MM-DD' se string.
+
+        Returns:
+            bool: True se for feriado, False caso contrário.
+
+        Raises:
+            ValueError: Se a data estiver fora do intervalo compilado.
+        """
+        vDate = self.__toDate(Date)
+        offset = vDate.toordinal() - self._FirstOrdinal
+        if offset < 0 or offset >= self._Days:
+            raise ValueError(f"Data {vDate} fora do intervalo do calendário compilado "
+                             f"({self._StartYear}-{self._EndYear})")
+        return (self._Holidays[offset >> 3] >> (offset & 7)) & 1 == 1
+
+    def isBusinessDay(self, Date: date) -> bool:
+        """Verifica se uma data é dia útil (não é feriado nem fim de semana).
+
+        Args:
+            Date (date ou str): Data a verificar, no formato 'YYYY-MM-DD' se string.
+
+        Returns:
+            bool: True se for dia útil, False caso contrário.
+
+        Raises:
+            ValueError: Se a data estiver fora do intervalo compilado.
+        """
+        vDate = self.__toDate(Date)
+        if self.isHoliday(vDate):
+            return False
+
+        weekday = vDate.weekday()  # 0=segunda, 5=sábado, 6=domingo
+        if self._Weekend is False:
+            return weekday < 5
+        return weekday != 6
+
+    def getFiscalYearStart(self, FiscalYear: int) -> date:
+        """Retorna a data de início do ano fiscal.
+
+        Anos fora da tabela compilada são calculados na hora.
+
+        Args:
+            FiscalYear: Ano fiscal.
+
+        Returns:
+            date: Data de início do ano fiscal.
+        """
+        index = FiscalYear - (self._StartYear - 1)
+        if index < 0 or FiscalYear > self._EndYear + 1:
+            return _getFiscalYearStart(FiscalYear)
+        return date.fromordinal(self._FiscalBase + self._Fiscal[index * 25])
+
+    def getFiscalMonthInfo(self, FiscalYear: int, FiscalMonth: int) -> tuple:
+        """Retorna início e fim de um mês fiscal.
+
+        Anos fora da tabela compilada são calculados na hora.
+
+        Args:
+            FiscalYear: Ano fiscal.
+            FiscalMonth: Mês fiscal (1-12).
+
+        Returns:
+            tuple: (data_início, data_fim) do mês fiscal.
+
+        Raises:
+            ValueError: Se FiscalMonth não estiver entre 1 e 12.
+        """
+        if FiscalMonth < 1 or FiscalMonth > 12:
+            raise ValueError("FiscalMonth deve estar entre 1 e 12")
+        index = FiscalYear - (self._StartYear - 1)
+        if index < 0 or FiscalYear > self._EndYear + 1:
+            return _getFiscalMonthInfo(_getFiscalYearStart(FiscalYear), FiscalMonth, FiscalYear)
+        position = index * 25 + 2 * FiscalMonth - 1
+        return (date.fromordinal(self._FiscalBase + self._Fiscal[position]),
+                date.fromordinal(self._FiscalBase + self._Fiscal[position + 1]))
+
+    def getFiscalMonthFromDate(self, Date: date) -> tuple:
+        """Determina o ano e mês fiscal para uma data.
+
+        Args:
+            Date (date ou str): Data a ser analisada, no formato 'YYYY-MM-DD' se string.
+
+        Returns:
+            tuple: (ano_fiscal, mês_fiscal) onde mês_fiscal é 1-12.
+        """
+        return _getFiscalMonthFromDate(
+            self.__toDate(Date), self.getFiscalYearStart,
+            lambda fiscal_year_start, fiscal_month, fiscal_year: self.getFiscalMonthInfo(fiscal_year, fiscal_month))
+
+
 class intdate():
     """Classe para manipulação e incremento de datas.
     
@@ -24,8 +524,12 @@ class intdate():
         Alignment (str): Alinhamento da data. Valores: 'B' (início), 'E' (fim), 'S' (mesmo dia).
         Country (str, optional): Código do país para cálculo de dias úteis (obrigatório se Interval='BDAY').
         State (str, optional): Código do estado/província para cálculo de dias úteis.
-        Weekend (bool, optional): Se False, sábado não é dia útil. Se True, apenas domingo não é dia útil.
+        Weekend (bool, optional): Se False (padrão), sábado não é dia útil. Se True, apenas domingo não é dia útil.
         CalendarType (str, optional): Tipo de calendário. Valores: 'NORMAL' (padrão) ou 'FISCAL' (4-4-5).
+        Calendar (compiledcalendar, optional): Calendário compilado. Quando informado, feriados,
+            fim de semana e meses fiscais vêm das tabelas do calendário, sem acesso à biblioteca
+            holidays. Country, State e Weekend passam a ser opcionais e, se informados, devem
+            corresponder aos do calendário.
     
     Examples:
         >>> from bonniebully import intdate
@@ -36,11 +540,15 @@ class intdate():
         >>> 
         >>> # Calcular 5 dias úteis
         >>> result = intdate('BDAY', date(2024, 1, 15), 5, 'S', 'BR', 'SP').getDates()
+        >>> 
+        >>> # Calcular 5 dias úteis com calendário compilado
+        >>> cal = compiledcalendar(2020, 2030, 'BR', 'SP')
+        >>> result = intdate('BDAY', date(2024, 1, 15), 5, 'S', Calendar=cal).getDates()
     """
 
     def __init__(self, Interval: str, Date: date, Increment: int,
-                 Alignment: str, Country: str = "", State: str = "", Weekend: bool = False,
-                 CalendarType: str = "NORMAL"):
+                 Alignment: str, Country: str = "", State: str = "", Weekend: Optional[bool] = None,
+                 CalendarType: str = "NORMAL", Calendar: Optional[compiledcalendar] = None):
 
         # Validação de parâmetros
         if not isinstance(Interval, str):
@@ -51,8 +559,16 @@ class intdate():
             raise ValueError("Alignment deve ser 'B', 'E' ou 'S'")
         if Interval.upper() not in ["YEAR", "MONTH", "DAY", "BDAY"]:
             raise ValueError("Interval deve ser 'YEAR', 'MONTH', 'DAY' ou 'BDAY'")
-        if Interval.upper() == "BDAY" and not Country:
+        if Calendar is not None and not isinstance(Calendar, compiledcalendar):
+            raise TypeError("Calendar deve ser um compiledcalendar")
+        if Interval.upper() == "BDAY" and not Country and Calendar is None:
             raise ValueError("Country é obrigatório quando Interval é 'BDAY'")
+        if Calendar is not None and (Country or State) and \
+                (Country.upper() if Country else Calendar.Country.upper(), State.upper()) != \
+                (Calendar.Country.upper(), Calendar.State.upper()):
+            raise ValueError("Country e State devem corresponder aos do Calendar")
+        if Calendar is not None and Weekend is not None and bool(Weekend) != Calendar.Weekend:
+            raise ValueError("Weekend deve corresponder ao do Calendar")
         if CalendarType.upper() not in ["NORMAL", "FISCAL"]:
             raise ValueError("CalendarType deve ser 'NORMAL' ou 'FISCAL'")
 
@@ -61,8 +577,9 @@ class intdate():
         self._Alignment = Alignment
         self._Country = Country  # Corrigido: era _Contry
         self._State = State
-        self._Weekend = Weekend
+        self._Weekend = bool(Weekend)
         self._CalendarType = CalendarType.upper()
+        self._Calendar = Calendar
         self._EndDate = ''
 
         if isinstance(Date, str) is True:
@@ -79,283 +596,23 @@ class intdate():
 
         vDayClass = self._Date.day
 
-        def __getLastMondayOfMonth(year: int, month: int) -> date:
-            """Retorna a última segunda-feira do mês.
-            
-            Args:
-                year: Ano.
-                month: Mês (1-12).
-            
-            Returns:
-                date: Última segunda-feira do mês especificado.
-            """
-            # Último dia do mês
-            if month == 12:
-                last_day = date(year, 12, 31)
-            else:
-                last_day = date(year, month + 1, 1) - relativedelta(days=1)
-            
-            # Encontra a última segunda-feira do mês
-            if last_day.weekday() == 0:
-                return last_day
-            else:
-                days_back = last_day.weekday()
-                return last_day - relativedelta(days=days_back)
-
-        def __getLastCompleteWeekMonday(year: int, month: int) -> date:
-            """Retorna a última segunda-feira do mês onde a semana está completa.
-            
-            Semana completa: segunda a domingo, todos os dias dentro do mês.
-            
-            Args:
-                year: Ano.
-                month: Mês (1-12).
-            
-            Returns:
-                date: Última segunda-feira onde a semana completa está dentro do mês.
-            """
-            # Último dia do mês
-            if month == 12:
-                last_day = date(year, 12, 31)
-            else:
-                last_day = date(year, month + 1, 1) - relativedelta(days=1)
-            
-            # Encontra a última segunda-feira do mês
-            if last_day.weekday() == 0:
-                last_monday = last_day
-            else:
-                days_back = last_day.weekday()
-                last_monday = last_day - relativedelta(days=days_back)
-            
-            # Verifica se a semana está completa (domingo ainda está no mês)
-            week_end = last_monday + relativedelta(days=6)  # Domingo da semana
-            
-            # Se o domingo não está no mesmo mês, retrocede uma semana
-            # A última semana completa: domingo é o último dia do mês
-            if week_end.month != month or week_end.year != year:
-                last_monday = last_monday - relativedelta(weeks=1)
-            
-            return last_monday
-
-        def __getLastCompleteWeekSunday(year: int, month: int) -> date:
-            """Retorna o domingo da última semana completa do mês.
-            
-            Args:
-                year: Ano.
-                month: Mês (1-12).
-            
-            Returns:
-                date: Domingo da última semana completa do mês.
-            """
-            last_monday = __getLastCompleteWeekMonday(year, month)
-            return last_monday + relativedelta(days=6)  # Domingo da semana
-
         def __getFiscalYearStart(year: int) -> date:
-            """Retorna a data de início do ano fiscal.
-            
-            O ano fiscal N começa na última segunda-feira de novembro do ano N-1
-            onde a semana está completa.
-            
-            Args:
-                year: Ano fiscal.
-            
-            Returns:
-                date: Data de início do ano fiscal (última segunda-feira de novembro do ano anterior).
-            """
-            return __getLastCompleteWeekMonday(year - 1, 11)
+            """Retorna a data de início do ano fiscal (do Calendar, se informado)."""
+            if self._Calendar is not None:
+                return self._Calendar.getFiscalYearStart(year)
+            return _getFiscalYearStart(year)
 
         def __getFiscalMonthInfo(fiscal_year_start: date, fiscal_month: int, fiscal_year: int):
-            """Retorna início e fim de um mês fiscal.
-            
-            Cada mês fiscal começa na segunda-feira e termina no domingo.
-            O mês fiscal 1 começa na última segunda-feira de dezembro (se dia >= 28)
-            ou na primeira segunda-feira de janeiro. O mês fiscal 12 termina no
-            primeiro domingo de janeiro do ano seguinte que fecha semana completa.
-            
-            Args:
-                fiscal_year_start: Data de início do ano fiscal.
-                fiscal_month: Mês fiscal (1-12).
-                fiscal_year: Ano fiscal.
-            
-            Returns:
-                tuple: (data_início, data_fim) do mês fiscal.
-            """
-            if fiscal_month == 1:
-                # Mês fiscal 1: começa na última segunda-feira de dezembro do ano anterior
-                # OU na primeira segunda-feira de janeiro, a que for mais próxima do início do ano
-                # Encontra a última segunda-feira de dezembro (não necessariamente onde semana está completa)
-                dec_last = date(fiscal_year - 1, 12, 31)
-                if dec_last.weekday() == 0:
-                    dec_last_monday = dec_last
-                else:
-                    days_back = dec_last.weekday()
-                    dec_last_monday = dec_last - relativedelta(days=days_back)
-                
-                jan_first = date(fiscal_year, 1, 1)
-                
-                # Calcula a primeira segunda-feira de janeiro
-                if jan_first.weekday() == 0:
-                    jan_first_monday = jan_first
-                else:
-                    days_to_monday = (7 - jan_first.weekday()) % 7
-                    if days_to_monday == 0:
-                        days_to_monday = 7
-                    jan_first_monday = jan_first + relativedelta(days=days_to_monday)
-                
-                # Regra: se 1º de janeiro é segunda-feira, usa ele
-                # Caso contrário, usa a última segunda-feira de dezembro se ela estiver em 28, 29, 30 ou 31 de dezembro
-                # Senão usa a primeira segunda-feira de janeiro
-                if jan_first.weekday() == 0:
-                    # 1º de janeiro é segunda-feira, usa ele
-                    month_start = jan_first
-                else:
-                    # Verifica se a última segunda-feira de dezembro está no final de dezembro (28-31)
-                    if dec_last_monday.day >= 28:
-                        # Última segunda-feira de dezembro está no final do mês, usa ela
-                        month_start = dec_last_monday
-                    else:
-                        # Usa a primeira segunda-feira de janeiro
-                        month_start = jan_first_monday
-                
-                # Termina no último domingo de janeiro
-                month_end = __getLastCompleteWeekSunday(fiscal_year, 1)
-                
-            elif fiscal_month == 12:
-                # Mês fiscal 12: começa na última segunda-feira de novembro onde a semana está completa
-                month_start = __getLastCompleteWeekMonday(fiscal_year, 11)
-                
-                # Termina no primeiro domingo de janeiro do ano seguinte que fecha uma semana completa
-                # a partir do início do mês 12
-                jan_first = date(fiscal_year + 1, 1, 1)
-                
-                # Encontra o primeiro domingo de janeiro
-                if jan_first.weekday() == 6:  # Domingo
-                    first_sunday = jan_first
-                else:
-                    days_to_sunday = (6 - jan_first.weekday()) % 7
-                    if days_to_sunday == 0:
-                        days_to_sunday = 7
-                    first_sunday = jan_first + relativedelta(days=days_to_sunday)
-                
-                # Verifica se o primeiro domingo de janeiro fecha uma semana completa
-                days_diff = (first_sunday - month_start).days
-                if (days_diff + 1) % 7 == 0:  # Fecha semana completa
-                    month_end = first_sunday
-                else:
-                    # Não fecha, vai até o próximo domingo
-                    month_end = first_sunday + relativedelta(weeks=1)
-                    
-            else:
-                # Meses fiscais 2-11: mapeia para meses calendário
-                # Mês fiscal 2 = janeiro, 3 = fevereiro, ..., 11 = outubro
-                calendar_month = fiscal_month - 1
-                
-                # Início: última segunda-feira do mês calendário correspondente
-                # Mês fiscal 2 começa na última segunda-feira de janeiro
-                # Mês fiscal 3 começa na última segunda-feira de fevereiro
-                # etc.
-                month_start = __getLastMondayOfMonth(fiscal_year, calendar_month)
-                
-                # Fim: último domingo do mês calendário seguinte
-                # Mês fiscal 2 termina no último domingo de fevereiro
-                # Mês fiscal 3 termina no último domingo de março (ou primeiro domingo de abril)
-                next_calendar_month = calendar_month + 1
-                if next_calendar_month > 12:
-                    next_calendar_month = 1
-                    next_calendar_year = fiscal_year + 1
-                else:
-                    next_calendar_year = fiscal_year
-                
-                month_end = __getLastCompleteWeekSunday(next_calendar_year, next_calendar_month)
-                
-                # Verifica se fecha uma semana completa
-                # Para fechar semana completa (segunda a domingo), (days + 1) deve ser múltiplo de 7
-                days_diff = (month_end - month_start).days
-                if (days_diff + 1) % 7 != 0:  # Não fecha semana completa
-                    # Vai até o primeiro domingo do mês seguinte seguinte
-                    if next_calendar_month == 12:
-                        next_next_month = 1
-                        next_next_year = next_calendar_year + 1
-                    else:
-                        next_next_month = next_calendar_month + 1
-                        next_next_year = next_calendar_year
-                    
-                    next_next_month_first = date(next_next_year, next_next_month, 1)
-                    if next_next_month_first.weekday() == 6:  # Domingo
-                        first_sunday = next_next_month_first
-                    else:
-                        days_to_sunday = (6 - next_next_month_first.weekday()) % 7
-                        if days_to_sunday == 0:
-                            days_to_sunday = 7
-                        first_sunday = next_next_month_first + relativedelta(days=days_to_sunday)
-                    
-                    # Verifica se esse domingo fecha uma semana completa
-                    days_diff2 = (first_sunday - month_start).days
-                    if (days_diff2 + 1) % 7 == 0:
-                        month_end = first_sunday
-                    else:
-                        # Ainda não fecha, vai até o próximo domingo
-                        month_end = first_sunday + relativedelta(weeks=1)
-            
-            return month_start, month_end
+            """Retorna início e fim de um mês fiscal (do Calendar, se informado)."""
+            if self._Calendar is not None:
+                return self._Calendar.getFiscalMonthInfo(fiscal_year, fiscal_month)
+            return _getFiscalMonthInfo(fiscal_year_start, fiscal_month, fiscal_year)
 
         def __getFiscalMonthFromDate(vDate: date) -> tuple:
-            """Determina o ano e mês fiscal para uma data.
-            
-            Args:
-                vDate: Data a ser analisada.
-            
-            Returns:
-                tuple: (ano_fiscal, mês_fiscal) onde mês_fiscal é 1-12.
-            """
-            year = vDate.year
-            month = vDate.month
-            
-            # Tenta determinar o ano fiscal testando anos próximos
-            # O ano fiscal N começa em novembro do ano N-1
-            for test_year in [year - 1, year, year + 1]:
-                fiscal_year_start = __getFiscalYearStart(test_year)
-                # Calcula o fim do ano fiscal (mês 12)
-                month12_start, month12_end = __getFiscalMonthInfo(fiscal_year_start, 12, test_year)
-                
-                if fiscal_year_start <= vDate <= month12_end:
-                    fiscal_year = test_year
-                    # Agora determina qual mês fiscal
-                    # Testa cada mês fiscal
-                    for test_month in range(1, 13):
-                        month_start, month_end = __getFiscalMonthInfo(fiscal_year_start, test_month, fiscal_year)
-                        if month_start <= vDate <= month_end:
-                            return fiscal_year, test_month
-                    # Se não encontrou, retorna o mês 12
-                    return fiscal_year, 12
-            
-            # Se não encontrou em nenhum ano, assume o ano atual
-            # e tenta determinar o mês baseado no mês calendário
-            fiscal_year = year
-            if month == 11 or month == 12:
-                # Novembro ou dezembro podem ser mês 1 ou 12
-                # Verifica qual
-                fiscal_year_start = __getFiscalYearStart(year)
-                month1_start, month1_end = __getFiscalMonthInfo(fiscal_year_start, 1, year)
-                if month1_start <= vDate <= month1_end:
-                    return year, 1
-                else:
-                    return year, 12
-            elif month == 1:
-                # Janeiro pode ser mês 2 ou 3
-                fiscal_year_start = __getFiscalYearStart(year)
-                month2_start, month2_end = __getFiscalMonthInfo(fiscal_year_start, 2, year)
-                if month2_start <= vDate <= month2_end:
-                    return year, 2
-                else:
-                    return year, 3
-            else:
-                # Meses 2-10: mês fiscal = mês calendário + 2
-                # (fevereiro = mês fiscal 4, março = 5, etc.)
-                fiscal_month = month + 2
-                if fiscal_month > 12:
-                    fiscal_month = 12
-                return year, fiscal_month
+            """Determina o ano e mês fiscal para uma data (do Calendar, se informado)."""
+            if self._Calendar is not None:
+                return self._Calendar.getFiscalMonthFromDate(vDate)
+            return _getFiscalMonthFromDate(vDate)
 
         def __getAlignment(vYearMeth: int, vMonthMeth: int, vDayMeth: int):
             """Aplica o alinhamento à data.
@@ -532,7 +789,12 @@ class intdate():
             Returns:
                 int: 1 se NÃO for dia útil, 0 se for dia útil.
             """
-            
+
+            # Calendário compilado: consulta o bitset, sem usar a biblioteca holidays
+            if self._Calendar is not None:
+                return 0 if self._Calendar.isBusinessDay(vDate) else 1
+
+            import holidays
             vHoliday = holidays.country_holidays(
                 vCountry, subdiv=vState).get(vDate)
             